@@ -129,6 +129,11 @@ def scheduler(
 ) -> Scheduler[float, Callable[[], None], int]:
     """
     Create a scheduler that uses Asyncio.
+
+    @param queue: If desired, a custom L{PriorityQueue}, as for
+        L{schedulerFromDriver}.  Cancelled calls stay in it, marked as
+        L{fritter.boundaries.ScheduledState.cancelled}, until they reach its
+        front or it is compacted, and L{PriorityQueue.remove} is never called.
     """
     return schedulerFromDriver(
         AsyncioTimeDriver(loop if loop is not None else get_event_loop()),
@@ -65,13 +65,33 @@ class MemoryDriver:
             else:
                 return None
         self._currentTime += delta
+        self._runDueWork()
+        return delta
+
+    def advanceTo(self, timestamp: float) -> float:
+        """
+        Advance the clock of L{this driver <MemoryDriver>} to the absolute time
+        C{timestamp}, running any work scheduled up to and including that
+        time.  If C{timestamp} is in the past, the clock does not move.
+
+        @return: the amount of time that was advanced.
+        """
+        delta = max(0.0, timestamp - self._currentTime)
+        self._currentTime = max(self._currentTime, timestamp)
+        self._runDueWork()
+        return delta
+
+    def _runDueWork(self) -> None:
+        """
+        Run any scheduled work whose time has arrived, including work that is
+        rescheduled for an already-arrived time while running.
+        """
         while (self._scheduledWork is not None) and (
             self._currentTime >= self._scheduledWork[0]
         ):
             what = self._scheduledWork[1]
             self._scheduledWork = None
             what()
-        return delta
 
     def isScheduled(self) -> bool:
         """
@@ -103,6 +103,11 @@ def scheduler(
 ) -> PhysicalScheduler:
     """
     Create a scheduler that uses Twisted.
+
+    @param queue: If desired, a custom L{PriorityQueue}, as for
+        L{schedulerFromDriver}.  Cancelled calls stay in it, marked as
+        L{fritter.boundaries.ScheduledState.cancelled}, until they reach its
+        front or it is compacted, and L{PriorityQueue.remove} is never called.
     """
     if reactor is None:
         from twisted.internet import reactor  # type:ignore[assignment]
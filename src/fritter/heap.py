@@ -1,13 +1,13 @@
 """
 Implementation of L{PriorityQueue} in terms of the standard library's
-L{heappop} and L{heappush} functions.
+L{heappop}, L{heappush} and L{heapify} functions.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from heapq import heappop, heappush
-from typing import Generic, Iterator, List, Optional
+from heapq import heapify, heappop, heappush
+from typing import Generic, Iterable, Iterator, List, Optional
 
 from .boundaries import Prioritized, PriorityQueue
 
@@ -25,6 +25,23 @@ class Heap(Generic[Prioritized]):
         "Implementation of L{PriorityQueue.add}"
         heappush(self._values, item)
 
+    def addMany(self, items: Iterable[Prioritized]) -> None:
+        """
+        Add several items to the heap at once.  This is not part of
+        L{PriorityQueue}, but schedulers will use it when it is available.
+
+        When adding more items than the heap already holds, it is cheaper to
+        rebuild the heap in linear time than to push each item individually.
+        """
+        values = self._values
+        new = list(items)
+        if len(new) > len(values):
+            values.extend(new)
+            heapify(values)
+        else:
+            for item in new:
+                heappush(values, item)
+
     def get(self) -> Optional[Prioritized]:
         "Implementation of  L{PriorityQueue.get}"
         if not self._values:
@@ -38,17 +55,65 @@ class Heap(Generic[Prioritized]):
         return self._values[0]
 
     def remove(self, item: Prioritized) -> bool:
-        "Implementation of L{PriorityQueue.remove}"
+        """
+        Implementation of L{PriorityQueue.remove}.
+
+        Finding C{item} is a linear scan, but the heap is then repaired by
+        moving the last item into its place and sifting it, rather than by
+        shifting every following item over.
+        """
+        values = self._values
         try:
-            self._values.remove(item)
+            index = values.index(item)
         except ValueError:
             return False
-        else:
-            return True
+        last = values.pop()
+        if index < len(values):
+            values[index] = last
+            _siftUp(values, index)
+            _siftDown(values, index)
+        return True
 
     def __iter__(self) -> Iterator[Prioritized]:
         "Implementation of L{PriorityQueue.__iter__}"
         return iter(self._values)
 
 
+def _siftUp(values: List[Prioritized], index: int) -> None:
+    """
+    Move the item at C{index} towards the root of the heap in C{values} until
+    its parent is no greater than it.
+    """
+    item = values[index]
+    while index > 0:
+        parentIndex = (index - 1) >> 1
+        parent = values[parentIndex]
+        if not item < parent:
+            break
+        values[index] = parent
+        index = parentIndex
+    values[index] = item
+
+
+def _siftDown(values: List[Prioritized], index: int) -> None:
+    """
+    Move the item at C{index} away from the root of the heap in C{values}
+    until neither of its children is less than it.
+    """
+    item = values[index]
+    end = len(values)
+    childIndex = 2 * index + 1
+    while childIndex < end:
+        rightIndex = childIndex + 1
+        if rightIndex < end and values[rightIndex] < values[childIndex]:
+            childIndex = rightIndex
+        child = values[childIndex]
+        if not child < item:
+            break
+        values[index] = child
+        index = childIndex
+        childIndex = 2 * index + 1
+    values[index] = item
+
+
 _HeapIsQueue: type[PriorityQueue[int]] = Heap[int]
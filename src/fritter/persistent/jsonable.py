@@ -31,8 +31,8 @@ from __future__ import annotations
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
-from json import dump as save_json
-from json import load as load_json
+from json import dumps as save_json
+from json import loads as load_json
 from pathlib import Path
 from typing import (
     Any,
@@ -697,8 +697,11 @@ class JSONRegistry(Generic[BootstrapT]):
         if (it := which.get(typeCode)) is not None:
             return it
 
-        classCode, methodName = typeCode.rsplit(".", 1)
-        if (instanceType := self._instances.get(classCode)) is not None:
+        classCode, _, methodName = typeCode.rpartition(".")
+        instanceType = self._instances.get(classCode)
+        # Make sure the method exists before calling fromJSON, so that an
+        # unknown method name fails without constructing an instance.
+        if instanceType is not None and hasattr(instanceType, methodName):
             # TODO: record allowable instance/method pairs so that we have some
             # confidence that the resulting type here is in fact actually
             # `JSONableType`.  probably the right way to do this is to have
@@ -853,6 +856,10 @@ class JSONRegistry(Generic[BootstrapT]):
         new: JSONableScheduler[BootstrapT] = schedulerFromDriver(
             runtimeDriver, carefulCounter, queue=h
         )
+        if not serializedJSON["scheduledCalls"]:
+            # Nothing to load, but new calls are still numbered by
+            # carefulCounter, just as they would be after loading some.
+            return new, self._saverFor(h, new)
 
         @contextmanager
         def idForcer(forcedID: int) -> Iterator[None]:
@@ -1063,15 +1070,15 @@ def schedulerAtPath(
     bootstrap: BootstrapT,
 ) -> Iterator[JSONableScheduler[BootstrapT]]:
     if path.exists():
-        with path.open() as rf:
-            scheduler, saver = registry.loadScheduler(
-                driver, load_json(rf), bootstrap
-            )
+        scheduler, saver = registry.loadScheduler(
+            driver, load_json(path.read_bytes()), bootstrap
+        )
     else:
         scheduler, saver = registry.createScheduler(driver)
     yield scheduler
-    with path.open("w") as wf:
-        save_json(saver(), wf)
+    # Serialize fully before opening the file for writing, so that it is
+    # written in one call rather than once per encoder chunk.
+    path.write_bytes(save_json(saver()).encode("utf-8"))
 
 
 __all__ = [
@@ -103,16 +103,19 @@ class EachWeekOn:
         sdays = sorted([day.value for day in self.days])
         steps: list[DateTime[TZType]] = []
         refDay = reference.date().weekday()
+        # Adding a timedelta to an aware datetime is wall-clock arithmetic, so
+        # the time of day can be set once up front rather than per candidate.
+        refAtTime = reference.replace(
+            hour=self.hour,
+            minute=self.minute,
+            second=self.second,
+            microsecond=0,
+        )
         weekOffset = 0
         while True:
             for sday in sdays:
                 daydelta = timedelta(days=(weekOffset + sday) - refDay)
-                candidate = (reference + daydelta).replace(
-                    hour=self.hour,
-                    minute=self.minute,
-                    second=self.second,
-                    microsecond=0,
-                )
+                candidate = refAtTime + daydelta
 
                 if candidate < reference:
                     # earlier than the reference time, let's ignore
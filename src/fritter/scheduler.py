@@ -9,10 +9,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from itertools import count
-from typing import Callable, Generic, overload
+from typing import Callable, Generic, Iterable, Sequence, overload
 
 from .boundaries import (
     IDT,
+    IDTCo,
     PriorityQueue,
     ScheduledCall,
     ScheduledState,
@@ -34,8 +35,7 @@ class ConcreteScheduledCall(Generic[WhenT, WhatT, IDT]):
     _what: WhatT | None = field(compare=False)
     _id: IDT = field(compare=True)
 
-    _called: bool = field(compare=False)
-    _cancelled: bool = field(compare=False)
+    _state: ScheduledState = field(compare=False)
     _canceller: (
         Callable[[ConcreteScheduledCall[WhenT, WhatT, IDT]], None] | None
     ) = field(compare=False)
@@ -45,11 +45,12 @@ class ConcreteScheduledCall(Generic[WhenT, WhatT, IDT]):
         Invoke the callable and adjust the state.
         """
         assert self._what is not None, "ScheduledCall invoked twice."
-        self._called = True
+        self._state = ScheduledState.called
         try:
             self._what()
         finally:
             self._what = None
+            self._canceller = None
 
     @property
     def id(self) -> IDT:
@@ -82,12 +83,7 @@ class ConcreteScheduledCall(Generic[WhenT, WhatT, IDT]):
         Is this call still waiting to be called, or has it been called or
         cancelled?
         """
-        if self._cancelled:
-            return ScheduledState.cancelled
-        if self._called:
-            return ScheduledState.called
-        assert self._what is not None
-        return ScheduledState.pending
+        return self._state
 
     def cancel(self) -> None:
         """
@@ -95,12 +91,14 @@ class ConcreteScheduledCall(Generic[WhenT, WhatT, IDT]):
         in the future.  If the work described by C{when} has already been
         called, or this call has already been cancelled, do nothing.
         """
-        if self._canceller is None:
+        if self._state is not ScheduledState.pending:
             return
-        self._cancelled = True
+        assert self._canceller is not None
+        self._state = ScheduledState.cancelled
         try:
             self._canceller(self)
         finally:
+            self._what = None
             self._canceller = None
 
 
@@ -111,6 +109,12 @@ class _PriorityQueueBackedSchedulerImpl(Generic[WhenT, WhatT, IDT]):
     be at least a 0-argument None-returning callable) at a given time
     (C{WhenT}, which much be sortable as a L{PriorityComparable}).
 
+    Cancelled calls are left in the queue and discarded when they reach the
+    front of it, so that cancelling does not need to search the queue.  The
+    front of the queue is always kept pending, and the queue is compacted if
+    more than C{_minCancelledToCompact} cancelled calls come to outnumber
+    pending ones.
+
     @ivar driver: The L{TimeDriver} that this L{Scheduler} will use.
     """
 
@@ -118,6 +122,19 @@ class _PriorityQueueBackedSchedulerImpl(Generic[WhenT, WhatT, IDT]):
     _newID: Callable[[], IDT]
     _q: PriorityQueue[ConcreteScheduledCall[WhenT, WhatT, IDT]]
     _maxWorkBatch: int = 0xFF
+    _minCancelledToCompact: int = 50
+    _pendingCount: int = field(init=False, default=0)
+    _cancelledCount: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        """
+        Count any calls that were already in the queue we were given.
+        """
+        for each in self._q:
+            if each._state is ScheduledState.pending:
+                self._pendingCount += 1
+            elif each._state is ScheduledState.cancelled:
+                self._cancelledCount += 1
 
     def now(self) -> WhenT:
         """
@@ -125,6 +142,119 @@ class _PriorityQueueBackedSchedulerImpl(Generic[WhenT, WhatT, IDT]):
         """
         return self.driver.now()
 
+    def _advanceToNow(self) -> None:
+        """
+        Run all the calls whose time has come (up to C{_maxWorkBatch} of them)
+        and then ask the driver to wake us up for the next one.
+        """
+        timestamp = self.driver.now()
+        q = self._q
+        maxWorkBatch = self._maxWorkBatch
+        workPerformed = 0
+        while (
+            (each := q.peek()) is not None
+            and each._when <= timestamp
+            and workPerformed < maxWorkBatch
+        ):
+            popped = q.get()
+            assert popped is each
+            if each._state is ScheduledState.cancelled:
+                self._cancelledCount -= 1
+                continue
+            self._pendingCount -= 1
+            each._call()
+            workPerformed += 1
+        upNext = self._peekPending()
+        if upNext is not None:
+            self.driver.reschedule(upNext._when, self._advanceToNow)
+
+    def _cancelCall(
+        self, cancelled: ConcreteScheduledCall[WhenT, WhatT, IDT]
+    ) -> None:
+        """
+        Account for C{cancelled}, updating the driver if it was the next one
+        due.  Otherwise, it is left in the queue to be discarded later.
+        """
+        self._pendingCount -= 1
+        self._cancelledCount += 1
+        head = self._q.peek()
+        if head is not None and head._state is ScheduledState.cancelled:
+            new = self._peekPending()
+            if new is None:
+                self.driver.unschedule()
+            else:
+                self.driver.reschedule(new._when, self._advanceToNow)
+        elif self._cancelledCount > self._minCancelledToCompact and (
+            self._cancelledCount > self._pendingCount
+        ):
+            self._compact()
+
+    def _peekPending(self) -> ConcreteScheduledCall[WhenT, WhatT, IDT] | None:
+        """
+        Discard any cancelled calls from the front of the queue, then return
+        the pending call that is next due, if any.
+        """
+        q = self._q
+        while (
+            each := q.peek()
+        ) is not None and each._state is ScheduledState.cancelled:
+            q.get()
+            self._cancelledCount -= 1
+        return each
+
+    def _compact(self) -> None:
+        """
+        Rebuild the queue with only its pending calls.
+        """
+        q = self._q
+        pending = [each for each in q if each._state is ScheduledState.pending]
+        while q.get() is not None:
+            pass
+        self._addAll(pending)
+        self._cancelledCount = 0
+
+    def _addAll(
+        self, calls: list[ConcreteScheduledCall[WhenT, WhatT, IDT]]
+    ) -> None:
+        """
+        Add all of C{calls} to the queue, in bulk if it supports that (as
+        L{Heap.addMany} does), or one at a time otherwise.
+        """
+        q = self._q
+        addMany: (
+            Callable[
+                [Iterable[ConcreteScheduledCall[WhenT, WhatT, IDT]]], None
+            ]
+            | None
+        ) = getattr(q, "addMany", None)
+        if addMany is not None:
+            addMany(calls)
+        else:
+            for call in calls:
+                q.add(call)
+
+    def _newCall(
+        self, when: WhenT, what: WhatT
+    ) -> ConcreteScheduledCall[WhenT, WhatT, IDT]:
+        """
+        Create a new pending call, without adding it to the queue.
+        """
+        return ConcreteScheduledCall(
+            when, what, self._newID(), ScheduledState.pending, self._cancelCall
+        )
+
+    def _rescheduleAfterAdding(
+        self, previously: ConcreteScheduledCall[WhenT, WhatT, IDT] | None
+    ) -> None:
+        """
+        Update the driver if adding calls has changed which one is next.
+        """
+        currently = self._q.peek()
+        if currently is not None and (
+            previously is None or previously._when != currently._when
+        ):
+            self.driver.reschedule(currently._when, self._advanceToNow)
+
     def callAt(
         self, when: WhenT, what: WhatT
     ) -> ScheduledCall[WhenT, WhatT, IDT]:
@@ -135,47 +265,30 @@ class _PriorityQueueBackedSchedulerImpl(Generic[WhenT, WhatT, IDT]):
         @return: a L{ScheduledCall} that describes the pending call and allows
             for cancelling it.
         """
-
-        def advanceToNow() -> None:
-            timestamp = self.driver.now()
-            workPerformed = 0
-            while (
-                (each := self._q.peek()) is not None
-                and each._when <= timestamp
-                and workPerformed < self._maxWorkBatch
-            ):
-                popped = self._q.get()
-                assert popped is each
-                each._call()
-                workPerformed += 1
-            upNext = self._q.peek()
-            if upNext is not None:
-                self.driver.reschedule(upNext._when, advanceToNow)
-
-        def _cancelCall(
-            toRemove: ConcreteScheduledCall[WhenT, WhatT, IDT]
-        ) -> None:
-            old = self._q.peek()
-            self._q.remove(toRemove)
-            new = self._q.peek()
-            if new is None:
-                self.driver.unschedule()
-            elif old is None or new is not old:
-                self.driver.reschedule(new._when, advanceToNow)
-
         previously = self._q.peek()
-        call = ConcreteScheduledCall(
-            when, what, self._newID(), False, False, _cancelCall
-        )
+        call = self._newCall(when, what)
         self._q.add(call)
-        currently = self._q.peek()
-        # We just added a thing it can't be None even though peek has that
-        # signature
-        assert currently is not None
-        if previously is None or previously._when != currently._when:
-            self.driver.reschedule(currently._when, advanceToNow)
+        self._pendingCount += 1
+        self._rescheduleAfterAdding(previously)
         return call
 
+    def callAtMany(
+        self, calls: Iterable[tuple[WhenT, WhatT]]
+    ) -> Sequence[ScheduledCall[WhenT, WhatT, IDT]]:
+        """
+        Call each C{what} at its C{when}, as with L{callAt
+        <_PriorityQueueBackedSchedulerImpl.callAt>}, but only update the
+        L{TimeDriver} once, after all of the calls have been added.
+
+        @return: a L{ScheduledCall} for each call, in the order given.
+        """
+        previously = self._q.peek()
+        newCalls = [self._newCall(when, what) for (when, what) in calls]
+        self._addAll(newCalls)
+        self._pendingCount += len(newCalls)
+        self._rescheduleAfterAdding(previously)
+        return newCalls
+
 
 _TypeCheck: type[Scheduler[float, Callable[[], None], int]] = (
     _PriorityQueueBackedSchedulerImpl
@@ -217,6 +330,12 @@ def schedulerFromDriver(
     @param queue: If desired, a custom L{PriorityQueue} implementation.  By
         default, a new L{Heap} will be used.
 
+        Cancelled calls are not removed from the queue right away; they stay
+        in it, with a C{state} of L{ScheduledState.cancelled} and a C{what} of
+        C{None}, until they reach its front or the queue is compacted.  Code
+        that iterates the queue must therefore check each call's C{state}.
+        The scheduler never calls L{PriorityQueue.remove}.
+
     @param nextID: A callable that will generate new opaque IDs.  By default,
         sequential integers will be used.
     """
@@ -236,7 +355,25 @@ def schedulerFromDriver(
     )
 
 
+def callAtMany(
+    scheduler: Scheduler[WhenT, WhatT, IDTCo],
+    calls: Iterable[tuple[WhenT, WhatT]],
+) -> Sequence[ScheduledCall[WhenT, WhatT, IDTCo]]:
+    """
+    Schedule several calls at once; equivalent to calling L{callAt
+    <Scheduler.callAt>} on C{scheduler} with each C{(when, what)} pair in
+    C{calls}.  Schedulers created by L{schedulerFromDriver} will add all of
+    the calls before updating their L{TimeDriver}, rather than once per call.
+
+    @return: the L{ScheduledCall}s, in the same order as C{calls}.
+    """
+    if isinstance(scheduler, _PriorityQueueBackedSchedulerImpl):
+        return scheduler.callAtMany(calls)
+    return [scheduler.callAt(when, what) for (when, what) in calls]
+
+
 __all__ = [
     "ConcreteScheduledCall",
+    "callAtMany",
     "schedulerFromDriver",
 ]
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import count
 from json import dumps, loads
 from pathlib import Path
-from tempfile import mkdtemp
+from tempfile import TemporaryDirectory
 from typing import Any, Callable, Type
 from unittest import TestCase
 from zoneinfo import ZoneInfo
@@ -33,20 +34,33 @@ from ..persistent.jsonable import (
     schedulerAtPath,
 )
 from ..repeat.rules.datetimes import EachYear, daily
+from ..scheduler import callAtMany
 
 
-@dataclass
+@dataclass(slots=True)
 class RegInfo:
     madeCalls: list[str]
-    identityMap: dict[str, Any] = field(default_factory=dict)
+    identityMap: dict[int, Any] = field(default_factory=dict)
     lookupLater: list[LaterStopper] = field(default_factory=list)
 
 
 registry = JSONRegistry[RegInfo]()
 emptyRegistry = JSONRegistry[RegInfo]()
 PT = ZoneInfo(key="America/Los_Angeles")
+UTC = ZoneInfo(key="Etc/UTC")
+DT_JUL21 = aware(datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT), ZoneInfo)
+DT_JUL22 = aware(datetime(2023, 7, 22, 1, 1, 1, tzinfo=PT), ZoneInfo)
+TS_JUL21 = DT_JUL21.timestamp()
+TS_JUL22 = DT_JUL22.timestamp()
+STOP_TIMES_2029 = [
+    aware(datetime(2029, 1, day, tzinfo=PT), ZoneInfo) for day in range(1, 6)
+]
+SECONDS_PER_DAY = 60.0 * 60 * 24
+ONE_SECOND = timedelta(seconds=1)
+TWO_SECONDS = timedelta(seconds=2)
 
 globalCalls = []
+nextIdentity = count().__next__
 
 
 @registry.function
@@ -64,12 +78,13 @@ def repeatable(steps: int, scheduled: SomeScheduledCall) -> None:
     globalCalls.append(f"repeatable {steps}")
 
 
-@dataclass
+@dataclass(slots=True)
 class InstanceWithMethods:
     value: str
     info: RegInfo
     callCount: int = 0
     stoppers: list[Cancellable] = field(default_factory=list)
+    identity: int = field(default_factory=nextIdentity)
 
     @classmethod
     def typeCodeForJSON(self) -> str:
@@ -80,12 +95,14 @@ class InstanceWithMethods:
         cls, load: LoadProcess[RegInfo], json: JSONObject
     ) -> InstanceWithMethods:
         key = json["identity"]
-        if key in load.bootstrap.identityMap:
+        cached: InstanceWithMethods | None = load.bootstrap.identityMap.get(
+            key
+        )
+        if cached is not None:
             load.bootstrap.madeCalls.append(
                 f"InstanceWithMethods.fromJSON: {json['value']} (cached)"
             )
-            self: InstanceWithMethods = load.bootstrap.identityMap[key]
-            return self
+            return cached
         load.bootstrap.madeCalls.append(
             f"InstanceWithMethods.fromJSON: {json['value']}"
         )
@@ -96,7 +113,7 @@ class InstanceWithMethods:
     def toJSON(self, registry: JSONRegistry[RegInfo]) -> dict[str, object]:
         return {
             "value": self.value,
-            "identity": id(self),
+            "identity": self.identity,
         }
 
     @registry.method
@@ -129,7 +146,7 @@ class InstanceWithMethods:
 Handle = ScheduledCall[DateTime[ZoneInfo], JSONableCallable[RegInfo], int]
 
 
-@dataclass
+@dataclass(slots=True)
 class LaterStopper:
     handle: Handle
 
@@ -155,11 +172,12 @@ class LaterStopper:
         return new
 
 
-@dataclass
+@dataclass(slots=True)
 class Stoppable:
     runcall: Handle | None = None
     stopcall: Handle | None = None
     ran: bool = False
+    identity: int = field(default_factory=nextIdentity)
 
     def scheduleme(self, scheduler: JSONableScheduler[RegInfo]) -> None:
         """
@@ -167,10 +185,8 @@ class Stoppable:
         second in the future.
         """
         now = scheduler.now()
-        self.runcall = scheduler.callAt(now + timedelta(seconds=2), self.runme)
-        self.stopcall = scheduler.callAt(
-            now + timedelta(seconds=1), self.stopme
-        )
+        self.runcall = scheduler.callAt(now + TWO_SECONDS, self.runme)
+        self.stopcall = scheduler.callAt(now + ONE_SECOND, self.stopme)
 
     @classmethod
     def typeCodeForJSON(self) -> str:
@@ -184,7 +200,7 @@ class Stoppable:
             "runcall": save(self.runcall),
             "stopcall": save(self.stopcall),
             "ran": self.ran,
-            "id": id(self),
+            "id": self.identity,
         }
 
     @classmethod
@@ -192,9 +208,9 @@ class Stoppable:
         cls, load: LoadProcess[RegInfo], json: JSONObject
     ) -> Stoppable:
         ckey = json["id"]
-        if ckey in load.bootstrap.identityMap:
-            result: Stoppable = load.bootstrap.identityMap[ckey]
-            return result
+        cached: Stoppable | None = load.bootstrap.identityMap.get(ckey)
+        if cached is not None:
+            return cached
 
         def get(
             name: str,
@@ -236,9 +252,38 @@ def jsonScheduler(
     return registry.createScheduler(DateTimeDriver(driver))
 
 
+def driverAt(timestamp: float) -> MemoryDriver:
+    """
+    Create a L{MemoryDriver} already advanced to C{timestamp}.
+    """
+    memoryDriver = MemoryDriver()
+    memoryDriver.advanceTo(timestamp)
+    return memoryDriver
+
+
+def jsonSchedulerAt(
+    timestamp: float,
+) -> tuple[MemoryDriver, JSONableScheduler[RegInfo], Callable[[], JSONObject]]:
+    """
+    Create a L{MemoryDriver} already advanced to C{timestamp}, along with a
+    JSON-serializable scheduler (and its saver) driven by it.
+    """
+    memoryDriver = driverAt(timestamp)
+    return (memoryDriver, *jsonScheduler(memoryDriver))
+
+
+def roundTrip(saved: JSONObject) -> JSONObject:
+    """
+    Serialize C{saved} to JSON text and parse it back, as a scheduler saved to
+    and restored from disk would be.
+    """
+    result: JSONObject = loads(dumps(saved))
+    return result
+
+
 class PersistentSchedulerTests(TestCase):
     def tearDown(self) -> None:
-        del globalCalls[:]
+        globalCalls.clear()
 
     def test_scheduleRunSaveRun(self) -> None:
         """
@@ -246,28 +291,25 @@ class PersistentSchedulerTests(TestCase):
         """
         memoryDriver = MemoryDriver()
         scheduler, saver = jsonScheduler(memoryDriver)
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
-        dt2 = aware(
-            datetime(2023, 7, 22, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
         ri0 = RegInfo([])
         iwm = InstanceWithMethods("test_scheduleRunSaveRun-value", ri0)
-        scheduler.callAt(dt, call1)
-        scheduler.callAt(dt, iwm.method1)
-        scheduler.callAt(dt2, call2)
-        scheduler.callAt(dt2, iwm.method2)
-        memoryDriver.advance(dt.timestamp() + 1)
+        callAtMany(
+            scheduler,
+            [
+                (DT_JUL21, call1),
+                (DT_JUL21, iwm.method1),
+                (DT_JUL22, call2),
+                (DT_JUL22, iwm.method2),
+            ],
+        )
+        memoryDriver.advanceTo(TS_JUL21 + 1)
         self.assertEqual(globalCalls, ["hello"])
-        del globalCalls[:]
+        globalCalls.clear()
         saved = saver()
         memory2 = MemoryDriver()
         ri = RegInfo([])
         registry.loadScheduler(DateTimeDriver(memory2), saved, ri)
-        memory2.advance(dt2.timestamp() + 1)
+        memory2.advanceTo(TS_JUL22 + 1)
         self.assertEqual(globalCalls, ["goodbye"])
         self.assertEqual(
             ri0.madeCalls, ["test_scheduleRunSaveRun-value/method1"]
@@ -285,10 +327,7 @@ class PersistentSchedulerTests(TestCase):
         scheduled instance methods ought to be able to save handles to other
         instances and stuff
         """
-        memoryDriver = MemoryDriver()
-        scheduler, saver = jsonScheduler(memoryDriver)
-        dt = aware(datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT), ZoneInfo)
-        memoryDriver.advance(dt.timestamp() + 1)
+        memoryDriver, scheduler, saver = jsonSchedulerAt(TS_JUL21 + 1)
         s = Stoppable()
         self.assertEqual(s.ran, False)
         s.runme()
@@ -302,24 +341,12 @@ class PersistentSchedulerTests(TestCase):
         s3 = LaterStopper(s.stopcall)
         s4 = LaterStopper(s.runcall)
         s5 = LaterStopper(s.stopcall)
-        scheduler.callAt(
-            aware(datetime(2029, 1, 1, tzinfo=PT), ZoneInfo), s2.stop
-        )
-        scheduler.callAt(
-            aware(datetime(2029, 1, 2, tzinfo=PT), ZoneInfo), s3.stop
-        )
-        scheduler.callAt(
-            aware(datetime(2029, 1, 3, tzinfo=PT), ZoneInfo), s4.stop
+        *_, last = callAtMany(
+            scheduler,
+            zip(STOP_TIMES_2029, [s2.stop, s3.stop, s4.stop, s5.stop]),
         )
-        last = scheduler.callAt(
-            aware(datetime(2029, 1, 4, tzinfo=PT), ZoneInfo), s5.stop
-        )
-        scheduler.callAt(
-            aware(datetime(2029, 1, 5, tzinfo=PT), ZoneInfo),
-            LaterStopper(last).stop,
-        )
-        jsonobj = dumps(saver())
-        saved = loads(jsonobj)
+        scheduler.callAt(STOP_TIMES_2029[4], LaterStopper(last).stop)
+        saved = roundTrip(saver())
         memory2 = MemoryDriver()
         ri = RegInfo([])
         registry.loadScheduler(DateTimeDriver(memory2), saved, ri)
@@ -335,11 +362,11 @@ class PersistentSchedulerTests(TestCase):
         self.assertEqual(rc.state, ScheduledState.pending)
         self.assertEqual(
             rc.when,
-            datetime(2023, 7, 21, 8, 1, 4, tzinfo=ZoneInfo(key="Etc/UTC")),
+            datetime(2023, 7, 21, 8, 1, 4, tzinfo=UTC),
         )
         self.assertIsNot(rc.what, None)
         self.assertEqual(rc.id, 0)
-        memory2.advance(dt.timestamp() + 4.0)
+        memory2.advanceTo(TS_JUL21 + 4.0)
         self.assertEqual(loadedStoppable.ran, False)
         self.assertIs(loadedStoppable.runcall, None)
         self.assertEqual(rc.state, ScheduledState.cancelled)
@@ -360,11 +387,11 @@ class PersistentSchedulerTests(TestCase):
     def test_schedulerAtPath(self) -> None:
         ri0 = RegInfo([])
         iwm = InstanceWithMethods("A", ri0)
-        mem = MemoryDriver()
-        p = Path(mkdtemp()) / "scheduler.json"
-        ts = datetime(2024, 2, 1, tzinfo=ZoneInfo("Etc/UTC")).timestamp()
-        mem.advance(ts)
-        aw = aware(datetime(2024, 2, 2, tzinfo=ZoneInfo("Etc/UTC")), ZoneInfo)
+        tempdir = TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        p = Path(tempdir.name) / "scheduler.json"
+        mem = driverAt(datetime(2024, 2, 1, tzinfo=UTC).timestamp())
+        aw = aware(datetime(2024, 2, 2, tzinfo=UTC), ZoneInfo)
         with schedulerAtPath(registry, DateTimeDriver(mem), p, ri0) as sched1:
             sched1.callAt(aw, iwm.method1)
         ri1 = RegInfo([])
@@ -403,18 +430,39 @@ class PersistentSchedulerTests(TestCase):
             )
         self.assertEqual(raised.exception.args[0], 7)
 
+    def test_unknownTypeCode(self) -> None:
+        for typeCode in ["instanceWithMethods.noSuchMethod", "noDotHere"]:
+            with self.subTest(typeCode=typeCode):
+                ri = RegInfo([])
+                oneCall = {
+                    "when": "2023-07-21T08:01:03",
+                    "tz": "Etc/UTC",
+                    "what": {
+                        "type": typeCode,
+                        "data": {"value": "unknown", "identity": 1},
+                    },
+                    "id": 1,
+                }
+                with self.assertRaises(KeyError) as ke:
+                    registry.loadScheduler(
+                        DateTimeDriver(MemoryDriver()),
+                        {"scheduledCalls": [oneCall]},
+                        ri,
+                    )
+                self.assertEqual(
+                    str(ke.exception),
+                    repr(f"cannot interpret type code {typeCode!r}"),
+                )
+                self.assertEqual(ri.madeCalls, [])
+
     def test_idling(self) -> None:
         memoryDriver = MemoryDriver()
         scheduler, saver = jsonScheduler(memoryDriver)
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
-        handle = scheduler.callAt(dt, call1)
+        handle = scheduler.callAt(DT_JUL21, call1)
         self.assertEqual(memoryDriver.isScheduled(), True)
         handle.cancel()
         self.assertEqual(memoryDriver.isScheduled(), False)
-        memoryDriver.advance(dt.timestamp() + 1)
+        memoryDriver.advanceTo(TS_JUL21 + 1)
         self.assertEqual(globalCalls, [])
 
     def test_emptyScheduler(self) -> None:
@@ -424,33 +472,34 @@ class PersistentSchedulerTests(TestCase):
         )
         self.assertEqual(memory.isScheduled(), False)
 
-    def test_repeatable(self) -> None:
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
+    def test_emptySchedulerIDs(self) -> None:
+        """
+        Loading a saved scheduler with no calls in it numbers new calls with
+        the same counter as loading one with calls, starting from 1.
+        """
+        scheduler, saver = registry.loadScheduler(
+            DateTimeDriver(MemoryDriver()), {"scheduledCalls": []}, RegInfo([])
         )
-        memoryDriver = MemoryDriver()
-        memoryDriver.advance(dt.timestamp())
-        scheduler, saver = jsonScheduler(memoryDriver)
-        registry.repeatedly(scheduler, daily, repeatable, dt)
-        self.assertEqual(globalCalls, ["repeatable 1"])
-        del globalCalls[:]
+        self.assertEqual(scheduler.callAt(DT_JUL21, call1).id, 1)
+        self.assertEqual(scheduler.callAt(DT_JUL22, call2).id, 2)
 
-        def days(n: int) -> float:
-            return 60 * 60 * 24 * n
+    def test_repeatable(self) -> None:
+        memoryDriver, scheduler, saver = jsonSchedulerAt(TS_JUL21)
+        registry.repeatedly(scheduler, daily, repeatable, DT_JUL21)
+        self.assertEqual(globalCalls, ["repeatable 1"])
+        globalCalls.clear()
 
-        memoryDriver.advance(days(3))
+        memoryDriver.advance(SECONDS_PER_DAY * 3)
         self.assertEqual(globalCalls, ["repeatable 3"])
-        del globalCalls[:]
+        globalCalls.clear()
 
         newInfo = RegInfo([])
-        mem2 = MemoryDriver()
-        mem2.advance(dt.timestamp())
-        mem2.advance(days(7))
+        mem2 = driverAt(TS_JUL21 + SECONDS_PER_DAY * 7)
         self.assertEqual(mem2.isScheduled(), False)
-        registry.loadScheduler(
-            DateTimeDriver(mem2), loads(dumps(saver())), newInfo
-        )
+        # saver() builds a new object each time and loading does not modify
+        # it, so there's no need to copy it via a JSON round trip here;
+        # test_repeatableMethod covers that.
+        registry.loadScheduler(DateTimeDriver(mem2), saver(), newInfo)
         self.assertEqual(mem2.isScheduled(), True)
         amount = mem2.advance()
         assert amount is not None
@@ -459,10 +508,6 @@ class PersistentSchedulerTests(TestCase):
 
     def test_repeatEachYear(self) -> None:
         memoryDriver = MemoryDriver()
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
         scheduler: JSONableScheduler[RegInfo]
         scheduler, saver = jsonScheduler(memoryDriver)
         ri = RegInfo([])
@@ -473,14 +518,13 @@ class PersistentSchedulerTests(TestCase):
         repeatMethod: JSONableRepeatable[RegInfo, list[DateTime[ZoneInfo]]] = (
             iwm.repeatMethodDTZIL
         )
-        registry.repeatedly(scheduler, rrule, repeatMethod, dt)
+        registry.repeatedly(scheduler, rrule, repeatMethod, DT_JUL21)
         newInfo = RegInfo([])
-        mem2 = MemoryDriver()
-        mem2.advance(dt.timestamp())
+        mem2 = driverAt(TS_JUL21)
         registry.loadScheduler(
-            DateTimeDriver(mem2), loads(dumps(saver())), newInfo
+            DateTimeDriver(mem2), roundTrip(saver()), newInfo
         )
-        mem2.advance(timedelta(days=365 * 4).total_seconds())
+        mem2.advance(SECONDS_PER_DAY * 365 * 4)
         LA = "zoneinfo.ZoneInfo(key='America/Los_Angeles')"
         expectedCalls = [
             "InstanceWithMethods.fromJSON: test_repeatEachYear",
@@ -492,12 +536,7 @@ class PersistentSchedulerTests(TestCase):
         self.assertEqual(newInfo.madeCalls, expectedCalls)
 
     def test_repeatLoadError(self) -> None:
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
-        memoryDriver = MemoryDriver()
-        memoryDriver.advance(dt.timestamp())
+        memoryDriver = driverAt(TS_JUL21)
         oneCall = {
             "when": "2023-07-22T08:01:01",
             "tz": "Etc/UTC",
@@ -538,13 +577,7 @@ class PersistentSchedulerTests(TestCase):
         )
 
     def test_repeatableMethod(self) -> None:
-        dt = aware(
-            datetime(2023, 7, 21, 1, 1, 1, tzinfo=PT),
-            ZoneInfo,
-        )
-        memoryDriver = MemoryDriver()
-        memoryDriver.advance(dt.timestamp())
-        scheduler, saver = jsonScheduler(memoryDriver)
+        memoryDriver, scheduler, saver = jsonSchedulerAt(TS_JUL21)
         info = RegInfo([])
         inst = InstanceWithMethods("sample", info)
         method = inst.repeatMethod
@@ -560,12 +593,9 @@ class PersistentSchedulerTests(TestCase):
                 "repeatMethod 1 self.value='shared' self.callCount=2",
             ],
         )
-        del info.madeCalls[:]
-
-        def days(n: int) -> float:
-            return 60 * 60 * 24 * n
+        info.madeCalls.clear()
 
-        memoryDriver.advance(days(3))
+        memoryDriver.advance(SECONDS_PER_DAY * 3)
         expected = [
             "repeatMethod 3 self.value='sample' self.callCount=2",
             "repeatMethod 3 self.value='shared' self.callCount=3",
@@ -577,25 +607,21 @@ class PersistentSchedulerTests(TestCase):
         newInfo = RegInfo([])
         newNewInfo = RegInfo([])
 
-        def atTimeDriver() -> MemoryDriver:
-            x = MemoryDriver()
-            x.advance(dt.timestamp())
-            x.advance(days(7))
-            return x
+        weekLater = TS_JUL21 + SECONDS_PER_DAY * 7
 
-        mem2 = atTimeDriver()
-        mem3 = atTimeDriver()
+        mem2 = driverAt(weekLater)
+        mem3 = driverAt(weekLater)
 
         self.assertEqual(mem2.isScheduled(), False)
-        persistent = dumps(saver())
+        # loadScheduler does not modify its input, so one parse of the saved
+        # state can be shared by both loads below.
+        loaded = roundTrip(saver())
         loadedScheduler, saver2 = registry.loadScheduler(
-            DateTimeDriver(mem2), loads(persistent), newInfo
+            DateTimeDriver(mem2), loaded, newInfo
         )
-        repersistent = dumps(saver2())
         registry.loadScheduler(
-            DateTimeDriver(mem3), loads(repersistent), newNewInfo
+            DateTimeDriver(mem3), roundTrip(saver2()), newNewInfo
         )
-        loaded = loads(persistent)
         with self.assertRaises(KeyError):
             # TODO: allow for better error handling that doesn't just blow up
             # on the type code lookup failure
@@ -29,3 +29,24 @@ class QueueTests(TestCase):
         self.assertEqual(self.q.remove(10), True)
         self.assertEqual(self.q.get(), 9)
         self.assertEqual(self.q.get(), 11)
+
+    def test_addMany(self) -> None:
+        # more items than the heap holds, so it is rebuilt
+        self.q.add(5)
+        self.q.addMany([8, 1, 6])
+        # fewer items than the heap holds, so they are pushed individually
+        self.q.addMany([3, 7])
+        self.q.addMany([])
+        self.assertEqual(
+            [self.q.get() for _ in range(7)], [1, 3, 5, 6, 7, 8, None]
+        )
+
+    def test_removeKeepsOrder(self) -> None:
+        values = [49, 97, 53, 5, 33, 65, 62, 51, 38, 61, 45, 74, 27, 64, 17]
+        for value in values:
+            self.q.add(value)
+        self.assertEqual(self.q.remove(33), True)
+        values.remove(33)
+        self.assertEqual(
+            [self.q.get() for _ in range(len(values))], sorted(values)
+        )
@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 
 from datetype import DateTime, aware
 from twisted.internet.defer import CancelledError, Deferred, succeed
+from twisted.python.failure import Failure
 
 from ..boundaries import (
     Cancellable,
@@ -25,6 +26,21 @@ from ..scheduler import schedulerFromDriver
 TZ = ZoneInfo("America/Los_Angeles")
 
 
+def ignoreCancel(d: Deferred[None]) -> None:
+    """
+    Canceller that does nothing, leaving L{Deferred.cancel} to fail the
+    L{Deferred} with L{CancelledError}.
+    """
+
+
+def trapCancelled(failure: Failure) -> None:
+    """
+    Errback that suppresses L{CancelledError} and lets any other failure
+    propagate.
+    """
+    failure.trap(CancelledError)
+
+
 class RepeatTestCase(TestCase):
     def test_synchronous(self) -> None:
         mem = MemoryDriver()
@@ -32,7 +48,7 @@ class RepeatTestCase(TestCase):
 
         def work(steps: int, scheduled: SomeScheduledCall) -> None:
             now = mem.now()
-            if mem.now() >= 10.0:
+            if now >= 10.0:
                 scheduled.cancel()
             calls.append((steps, now))
 
@@ -40,11 +56,11 @@ class RepeatTestCase(TestCase):
 
         self.assertTrue(mem.isScheduled())
         self.assertEqual(calls, [(1, 0.0)])
-        calls = []
+        calls.clear()
         mem.advance()
         self.assertTrue(mem.isScheduled())
         self.assertEqual(calls, [(1, 5.0)])
-        calls = []
+        calls.clear()
         mem.advance()
         self.assertFalse(mem.isScheduled())
         self.assertEqual(calls, [(1, 10.0)])
@@ -73,17 +89,17 @@ class RepeatTestCase(TestCase):
         self.assertEqual(calls, ["before 0 (1)"])
         event.callback(None)
         self.assertEqual(calls, ["before 0 (1)", "after 0"])
-        del calls[:]
+        calls.clear()
         mem.advance(15.3)
         self.assertEqual(calls, ["before 1 (1)"])
-        del calls[:]
+        calls.clear()
         # async operation takes 45 seconds. it's now 60.3.
         mem.advance(45.0)
         self.assertEqual(calls, [])
         event.callback(None)
         # catch-up call is immediately scheduled
         self.assertEqual(calls, ["after 1", "before 2 (3)"])
-        del calls[:]
+        calls.clear()
         event.callback(None)
         self.assertEqual(calls, ["after 2"])
 
@@ -122,15 +138,12 @@ class RepeatTestCase(TestCase):
         repeatCall: Deferred[None] | None = None
         pending: Deferred[None]
 
-        def cancelled(d: Deferred[None]) -> None:
-            return
-
-        pending = Deferred(cancelled)
+        pending = Deferred(ignoreCancel)
 
         async def bonk(d: Deferred[None]) -> None:
             # odd idiom for suppressing cancellation to work around
             # https://github.com/nedbat/coveragepy/issues/1595#issuecomment-1931494916
-            await d.addErrback(lambda e: e.trap(CancelledError))
+            await d.addErrback(trapCancelled)
 
         async def asynchronously() -> None:
             nonlocal succeeding
@@ -162,13 +175,13 @@ class RepeatTestCase(TestCase):
 
         repeatCall.cancel()
         self.assertFalse(mem.isScheduled())
-        pending = Deferred(cancelled)
+        pending = Deferred(ignoreCancel)
         succeeding += 1
         tad.runAsync(run(asynchronously))
         self.assertTrue(mem.isScheduled())
         mem.advance()
         self.assertFalse(mem.isScheduled())
-        p, pending = pending, Deferred(cancelled)
+        p, pending = pending, Deferred(ignoreCancel)
         p.callback(None)
         self.assertTrue(mem.isScheduled())
         mem.advance()
@@ -234,13 +247,14 @@ class RepeatTestCase(TestCase):
         # 2/7, 2/9 skipped!
         self.assertEqual(datetime(2024, 2, 10, 15, 10, 5, tzinfo=TZ), fourth)
         bigSkip = [
-            *[
-                datetime(2024, 2, n, 15, 10, tzinfo=TZ)
-                for n in [12, 14, 16, 19, 21, 23, 26, 28]
-            ],
-            *[datetime(2024, 3, n, 15, 10, tzinfo=TZ) for n in [1, 4]],
+            datetime(2024, month, day, 15, 10, tzinfo=TZ)
+            for month, days in [
+                (2, [12, 14, 16, 19, 21, 23, 26, 28]),
+                (3, [1, 4]),
+            ]
+            for day in days
         ]
-        actual = list(chain(*[tries for (_, tries, _) in rest]))
+        actual = list(chain.from_iterable(tries for (_, tries, _) in rest))
         self.assertEqual(bigSkip, actual)
 
     def test_eachYear(self) -> None:
@@ -1,9 +1,23 @@
-from typing import Callable
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterator
 from unittest import TestCase
+from weakref import ref
 
-from ..boundaries import ScheduledState, Scheduler, PhysicalScheduler
+from ..boundaries import (
+    PhysicalScheduler,
+    Prioritized,
+    PriorityQueue,
+    ScheduledCall,
+    ScheduledState,
+    Scheduler,
+)
 from ..drivers.memory import MemoryDriver
-from ..scheduler import schedulerFromDriver
+from ..heap import Heap
+from ..scheduler import (
+    ConcreteScheduledCall,
+    callAtMany,
+    schedulerFromDriver,
+)
 
 
 class SchedulerTests(TestCase):
@@ -30,6 +44,7 @@ class SchedulerTests(TestCase):
         self.assertEqual(1, called)
         self.assertEqual(handle.state, ScheduledState.called)
         handle.cancel()  # no-op
+        self.assertEqual(handle.state, ScheduledState.called)
 
     def test_moveSooner(self) -> None:
         driver = MemoryDriver()
@@ -58,6 +73,74 @@ class SchedulerTests(TestCase):
         self.assertEqual(first.state, ScheduledState.called)
         self.assertEqual(second.state, ScheduledState.called)
 
+    def test_callAtMany(self) -> None:
+        """
+        C{callAtMany} schedules several calls at once, returning their handles
+        in the order they were given.
+        """
+        driver = MemoryDriver()
+        scheduler: PhysicalScheduler = schedulerFromDriver(driver)
+        self.assertEqual(callAtMany(scheduler, []), [])
+        self.assertFalse(driver.isScheduled())
+        calls: list[str] = []
+        handles = callAtMany(
+            scheduler,
+            [
+                (3.0, lambda: calls.append("c")),
+                (1.0, lambda: calls.append("a")),
+                (2.0, lambda: calls.append("b")),
+            ],
+        )
+        self.assertEqual([each.when for each in handles], [3.0, 1.0, 2.0])
+        handles[2].cancel()
+        driver.advance()
+        self.assertEqual(calls, ["a"])
+        driver.advance()
+        self.assertEqual(calls, ["a", "c"])
+        self.assertFalse(driver.isScheduled())
+
+    def test_callAtManyOnlyCallAt(self) -> None:
+        """
+        C{callAtMany} works with any L{Scheduler}, calling C{callAt} for each
+        call if the scheduler does not provide a way to add them in bulk.
+        """
+        driver = MemoryDriver()
+        scheduler = OnlyCallAt(schedulerFromDriver(driver))
+        calls: list[str] = []
+        handles = callAtMany(
+            scheduler,
+            [
+                (2.0, lambda: calls.append("b")),
+                (1.0, lambda: calls.append("a")),
+            ],
+        )
+        self.assertEqual([each.when for each in handles], [2.0, 1.0])
+        driver.advance()
+        driver.advance()
+        self.assertEqual(calls, ["a", "b"])
+
+    def test_callAtManyPlainQueue(self) -> None:
+        """
+        C{callAtMany} adds calls one at a time to a L{PriorityQueue} that has
+        no C{addMany} method.
+        """
+        driver = MemoryDriver()
+        queue: PlainQueue[Call] = PlainQueue()
+        scheduler = schedulerFromDriver(driver, queue=queue)
+        calls: list[str] = []
+        callAtMany(
+            scheduler,
+            [
+                (2.0, lambda: calls.append("b")),
+                (1.0, lambda: calls.append("a")),
+            ],
+        )
+        self.assertEqual(len(list(queue)), 2)
+        driver.advance()
+        driver.advance()
+        self.assertEqual(calls, ["a", "b"])
+        self.assertFalse(driver.isScheduled())
+
     def test_canceling(self) -> None:
         """
         CallHandle.cancel() cancels an outstanding call.
@@ -99,6 +182,110 @@ class SchedulerTests(TestCase):
         driver.advance()
         self.assertEqual(callTimes, [(1.0, "a"), (3.0, "c")])
 
+    def test_cancelingCompacts(self) -> None:
+        """
+        Cancelled calls are left in the queue until they reach its front, but
+        the queue is compacted once most of its calls have been cancelled,
+        whether or not the queue can add calls in bulk.
+        """
+        queues: list[PriorityQueue[Call]] = [Heap(), PlainQueue()]
+        for queue in queues:
+            with self.subTest(queue=type(queue).__name__):
+                driver = MemoryDriver()
+                scheduler = schedulerFromDriver(driver, queue=queue)
+                called = []
+
+                def record(each: int) -> Callable[[], None]:
+                    return lambda: called.append(each)
+
+                handles = [
+                    scheduler.callAt(float(each), record(each))
+                    for each in range(100)
+                ]
+                for handle in handles[1:51]:
+                    handle.cancel()
+                self.assertEqual(len(list(queue)), 100)
+                handles[51].cancel()
+                self.assertEqual(len(list(queue)), 49)
+                self.assertTrue(all(each.what is not None for each in queue))
+                handles[0].cancel()
+                self.assertEqual(driver.advance(), 52.0)
+                while driver.advance() is not None:
+                    pass
+                self.assertEqual(called, list(range(52, 100)))
+
+    def test_weakReference(self) -> None:
+        """
+        A L{ScheduledCall} can be weakly referenced.
+        """
+        scheduler: PhysicalScheduler = schedulerFromDriver(MemoryDriver())
+        handle = scheduler.callAt(1.0, noop)
+        self.assertIs(ref(handle)(), handle)
+
+    def test_queueWithCalls(self) -> None:
+        """
+        A scheduler can be created with a queue that already has calls in it,
+        both pending and cancelled, and runs the pending ones in order with
+        its own once the driver has been scheduled.
+        """
+        queue: Heap[Call] = Heap()
+        called: list[str] = []
+        first = schedulerFromDriver(MemoryDriver(), queue=queue)
+        first.callAt(1.0, lambda: called.append("a"))
+        first.callAt(2.0, lambda: called.append("x")).cancel()
+        driver = MemoryDriver()
+        second = schedulerFromDriver(driver, queue=queue)
+        second.callAt(0.5, lambda: called.append("b"))
+        while driver.advance() is not None:
+            pass
+        self.assertEqual(called, ["b", "a"])
+        self.assertEqual(list(queue), [])
+
+
+Call = ConcreteScheduledCall[float, Callable[[], None], int]
+
+
+@dataclass
+class PlainQueue(Generic[Prioritized]):
+    """
+    A L{PriorityQueue} that provides nothing beyond the protocol's own
+    methods.
+    """
+
+    heap: Heap[Prioritized] = field(default_factory=Heap)
+
+    def add(self, item: Prioritized) -> None:
+        self.heap.add(item)
+
+    def get(self) -> Prioritized | None:
+        return self.heap.get()
+
+    def peek(self) -> Prioritized | None:
+        return self.heap.peek()
+
+    def remove(self, item: Prioritized) -> bool:
+        return self.heap.remove(item)
+
+    def __iter__(self) -> Iterator[Prioritized]:
+        return iter(self.heap)
+
+
+@dataclass
+class OnlyCallAt:
+    """
+    A L{Scheduler} that provides nothing beyond the protocol's own methods.
+    """
+
+    scheduler: PhysicalScheduler
+
+    def now(self) -> float:
+        return self.scheduler.now()
+
+    def callAt(
+        self, when: float, what: Callable[[], None]
+    ) -> ScheduledCall[float, Callable[[], None], object]:
+        return self.scheduler.callAt(when, what)
+
 
 def noop() -> None: ...
 
@@ -18,6 +18,19 @@ class MemoryDriverTests(TestCase):
         self.assertEqual(driver.isScheduled(), False)
         self.assertEqual(driver.advance(), None)
 
+    def test_advanceTo(self) -> None:
+        driver = MemoryDriver()
+        work = []
+        driver.advance(1)
+        driver.reschedule(3.5, lambda: work.append(driver.now()))
+        self.assertEqual(driver.advanceTo(3.0), 2.0)
+        self.assertEqual(work, [])
+        self.assertEqual(driver.advanceTo(10.0), 7.0)
+        self.assertEqual(work, [10.0])
+        self.assertEqual(driver.now(), 10.0)
+        self.assertEqual(driver.advanceTo(5.0), 0.0)
+        self.assertEqual(driver.now(), 10.0)
+
     def test_noBackwards(self) -> None:
         driver = MemoryDriver()
         count = 0
@@ -11,6 +11,8 @@ from ..drivers.memory import MemoryDriver
 from ..scheduler import schedulerFromDriver
 from ..tree import _BranchDriver, branch, timesFaster
 
+UTC = ZoneInfo("Etc/UTC")
+
 
 class RecursiveTest(TestCase):
     def _oneRecursiveCall(
@@ -56,8 +58,7 @@ class RecursiveTest(TestCase):
             DateTimeDriver(driver := MemoryDriver())
         )
         recursive, scheduler2 = branch(scheduler1)
-        TZ = ZoneInfo("Etc/UTC")
-        ts = datetime(2024, 2, 9, tzinfo=TZ).timestamp()
+        ts = datetime(2024, 2, 9, tzinfo=UTC).timestamp()
         driver.advance(ts)
         called = False
         called2 = False
@@ -71,10 +72,10 @@ class RecursiveTest(TestCase):
             called2 = True
 
         scheduler2.callAt(
-            DateTime.fromtimestamp(ts, TZ) + timedelta(days=1), callme
+            DateTime.fromtimestamp(ts, UTC) + timedelta(days=1), callme
         )
         scheduler2.callAt(
-            DateTime.fromtimestamp(ts, TZ) + timedelta(days=3), callme2
+            DateTime.fromtimestamp(ts, UTC) + timedelta(days=3), callme2
         )
         driver.advance(86400)
         self.assertTrue(called)
@@ -149,7 +150,7 @@ class RecursiveTest(TestCase):
         self.assertEqual(calls, [])
         driver.advance(1.5)
         self.assertEqual(calls, [(1.5, 1.5)])
-        calls[:] = []
+        calls.clear()
         recursive.pause()
         # paused at 1.5, with 0.5 left until second call (at 2.0)
         driver.advance(2.7)